@@ -1,6 +1,8 @@
+import copy
 import json
 import logging
 import random
+from functools import lru_cache
 from hashlib import sha256
 from pathlib import Path
 from typing import Any, Callable
@@ -12,6 +14,35 @@ from azure.mgmt.resource.resources.models import DeploymentMode
 
 UNIQUE_ID_LEN = 4
 
+# The deployment template is static, so parse it once and deep-copy it per
+# bootstrap, since the NSG security rules are modified in place.
+_TEMPLATE_PATH = Path(__file__).parent.joinpath("azure-config-template.json")
+with open(_TEMPLATE_PATH, "r") as _template_fp:
+    _TEMPLATE = json.load(_template_fp)
+_NSG_INDEX = next(
+    (
+        i
+        for i, resource in enumerate(_TEMPLATE["resources"])
+        if resource["type"] == "Microsoft.Network/networkSecurityGroups"
+    ),
+    None,
+)
+
+# NSG security rule opening the user-requested ports. destinationPortRanges is
+# filled in per cluster.
+_USER_PORTS_RULE = {
+    "name": "user-ports",
+    "properties": {
+        "priority": 1001,
+        "protocol": "TCP",
+        "access": "Allow",
+        "direction": "Inbound",
+        "sourceAddressPrefix": "*",
+        "sourcePortRange": "*",
+        "destinationAddressPrefix": "*",
+    },
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,6 +66,25 @@ def get_azure_sdk_function(client: Any, function_name: str) -> Callable:
     return func
 
 
+@lru_cache()
+def _get_cli_subscription_id() -> str:
+    """Return the subscription id of the Azure CLI profile.
+
+    Cached since it may shell out to the Azure CLI, which is slow.
+    """
+    return get_cli_profile().get_subscription_id()
+
+
+@lru_cache(maxsize=4)
+def _get_resource_client(subscription_id: str) -> ResourceManagementClient:
+    # Increase the timeout to fix the Azure get-access-token (used by ray azure
+    # node_provider) timeout issue.
+    # Tracked in https://github.com/Azure/azure-cli/issues/20404#issuecomment-1249575110
+    return ResourceManagementClient(
+        AzureCliCredential(process_timeout=30), subscription_id
+    )
+
+
 def bootstrap_azure(config):
     config = _configure_key_pair(config)
     config = _configure_resource_group(config)
@@ -46,13 +96,8 @@ def _configure_resource_group(config):
     # https://docs.microsoft.com/en-us/azure/virtual-machines/windows/tutorial-availability-sets
     subscription_id = config["provider"].get("subscription_id")
     if subscription_id is None:
-        subscription_id = get_cli_profile().get_subscription_id()
-    # Increase the timeout to fix the Azure get-access-token (used by ray azure
-    # node_provider) timeout issue.
-    # Tracked in https://github.com/Azure/azure-cli/issues/20404#issuecomment-1249575110
-    resource_client = ResourceManagementClient(
-        AzureCliCredential(process_timeout=30), subscription_id
-    )
+        subscription_id = _get_cli_subscription_id()
+    resource_client = _get_resource_client(subscription_id)
     config["provider"]["subscription_id"] = subscription_id
     logger.info("Using subscription id: %s", subscription_id)
 
@@ -75,37 +120,18 @@ def _configure_resource_group(config):
     )
     rg_create_or_update(resource_group_name=resource_group, parameters=params)
 
-    # load the template file
-    current_path = Path(__file__).parent
-    template_path = current_path.joinpath("azure-config-template.json")
-    with open(template_path, "r") as template_fp:
-        template = json.load(template_fp)
+    template = copy.deepcopy(_TEMPLATE)
 
     # Setup firewall rules for ports
-    nsg_resource = None
-    for resource in template["resources"]:
-        if resource["type"] == "Microsoft.Network/networkSecurityGroups":
-            nsg_resource = resource
-            break
-    assert nsg_resource is not None, "Could not find NSG resource in template"
+    assert _NSG_INDEX is not None, "Could not find NSG resource in template"
+    nsg_resource = template["resources"][_NSG_INDEX]
     ports = config["provider"].get("ports", None)
     if ports is not None:
-        ports = [str(port) for port in ports if port != 22]
-        nsg_resource["properties"]["securityRules"].append(
-            {
-                "name": "user-ports",
-                "properties": {
-                    "priority": 1001,
-                    "protocol": "TCP",
-                    "access": "Allow",
-                    "direction": "Inbound",
-                    "sourceAddressPrefix": "*",
-                    "sourcePortRange": "*",
-                    "destinationAddressPrefix": "*",
-                    "destinationPortRanges": ports,
-                },
-            }
-        )
+        rule = copy.deepcopy(_USER_PORTS_RULE)
+        rule["properties"]["destinationPortRanges"] = [
+            str(port) for port in ports if port != 22
+        ]
+        nsg_resource["properties"]["securityRules"].append(rule)
 
     logger.info("Using cluster name: %s", config["cluster_name"])
 
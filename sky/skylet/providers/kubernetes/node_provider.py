@@ -1,7 +1,10 @@
 import copy
+import functools
 import logging
+import random
+import threading
 import time
-from typing import Dict
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from uuid import uuid4
 
@@ -14,14 +17,34 @@ from ray.autoscaler.tags import TAG_RAY_NODE_KIND
 from sky.adaptors import kubernetes
 from sky.skylet.providers.kubernetes import config
 from sky.utils import kubernetes_utils
+from sky.utils import subprocess_utils
 
 logger = logging.getLogger(__name__)
 
 MAX_TAG_RETRIES = 3
 DELAY_BEFORE_TAG_RETRY = 0.5
 
+# Pods read within this many seconds are served from the per-provider cache.
+# The autoscaler typically calls is_running/node_tags/internal_ip back-to-back
+# on the same node, so a short TTL collapses those into a single API call.
+POD_CACHE_TTL_SECONDS = 0.5
+
+# The external IP is derived from the cluster's nodes (or the API server), not
+# from the pod itself, so it rarely changes and can be cached for longer.
+EXTERNAL_IP_CACHE_TTL_SECONDS = 60
+
 RAY_COMPONENT_LABEL = 'cluster.ray.io/component'
 
+# Match pods that are in the 'Pending' or 'Running' phase.
+# Unfortunately there is no OR operator in field selectors, so we
+# have to match on NOT any of the other phases.
+_NON_TERMINATED_FIELD_SELECTOR = ','.join([
+    'status.phase!=Failed',
+    'status.phase!=Unknown',
+    'status.phase!=Succeeded',
+    'status.phase!=Terminating',
+])
+
 
 # Monkey patch SSHCommandRunner to allow specifying SSH port
 def set_port(self, port):
@@ -31,22 +54,26 @@ def set_port(self, port):
 SSHCommandRunner.set_port = set_port
 
 
+@functools.lru_cache(maxsize=128)
 def head_service_selector(cluster_name: str) -> Dict[str, str]:
-    """Selector for Operator-configured head service."""
+    """Selector for Operator-configured head service.
+
+    The result is cached per cluster_name; callers must not mutate it.
+    """
     return {RAY_COMPONENT_LABEL: f'{cluster_name}-ray-head'}
 
 
 def to_label_selector(tags):
-    label_selector = ''
-    for k, v in tags.items():
-        if label_selector != '':
-            label_selector += ','
-        label_selector += '{}={}'.format(k, v)
-    return label_selector
+    return ','.join(f'{k}={v}' for k, v in tags.items())
 
 
 class KubernetesNodeProvider(NodeProvider):
 
+    # Maps (cluster_name, namespace) -> NodePort of the head node's SSH
+    # service. Shared across instances since the NodePort does not change
+    # for the lifetime of the service.
+    _port_cache: Dict[Tuple[str, str], int] = {}
+
     def __init__(self, provider_config, cluster_name):
         NodeProvider.__init__(self, provider_config, cluster_name)
         self.cluster_name = cluster_name
@@ -61,68 +88,150 @@ class KubernetesNodeProvider(NodeProvider):
         # kubernetes setups.
         self.timeout = provider_config['timeout']
 
-    def non_terminated_nodes(self, tag_filters):
-        # Match pods that are in the 'Pending' or 'Running' phase.
-        # Unfortunately there is no OR operator in field selectors, so we
-        # have to match on NOT any of the other phases.
-        field_selector = ','.join([
-            'status.phase!=Failed',
-            'status.phase!=Unknown',
-            'status.phase!=Succeeded',
-            'status.phase!=Terminating',
-        ])
-
+        self._core_api = kubernetes.core_api()
+        # The API server is fixed for the kubeconfig context, so its hostname
+        # is parsed once. Used as the fallback external IP.
+        self._api_server_host = urlparse(
+            self._core_api.api_client.configuration.host).hostname
+        # Guards _pod_cache and _last_list, since Ray calls provider methods
+        # from multiple threads (e.g., NodeUpdaters and terminate_nodes).
+        self._cache_lock = threading.Lock()
+        # Maps node_id -> (fetch timestamp, V1Pod).
+        self._pod_cache: Dict[str, Tuple[float, Any]] = {}
+        # Pods returned by the last non_terminated_nodes call, keyed by name.
+        # Ray allows providers to serve node_tags/is_running/etc. from the
+        # result of that call, which the autoscaler makes every update. See
+        # _get_pod for when an entry is reused.
+        self._last_list: Dict[str, Any] = {}
+        # (fetch timestamp, external IP) of the last external_ip lookup.
+        self._external_ip_cached: Optional[Tuple[float, str]] = None
+
+        # Warm the internal IP cache so that the first get_node_id calls do
+        # not need to hit the API server. Failures are not fatal here, since
+        # get_node_id refreshes the cache on a miss.
+        try:
+            self._refresh_internal_ip_cache(
+                request_timeout=kubernetes.API_TIMEOUT)
+        except (kubernetes.api_exception(), kubernetes.max_retry_error()) as e:
+            logger.debug(config.log_prefix +
+                         f'Failed to warm the internal IP cache: {e}')
+
+    def _refresh_internal_ip_cache(
+            self, request_timeout: Optional[int] = None) -> None:
+        # The listed pods already carry their IPs, so fill the cache from a
+        # single LIST instead of reading each pod.
+        for pod in self._list_non_terminated_pods(
+                {}, request_timeout=request_timeout):
+            if pod.status.pod_ip:
+                self._internal_ip_cache[pod.status.pod_ip] = pod.metadata.name
+
+    def _get_pod(self, node_id: str) -> Any:
+        """Returns the pod object for node_id, reusing a recent read.
+
+        Pods from the last non_terminated_nodes call are reused only once
+        they are Running with an IP assigned. Pods that were still starting
+        up are read again, so callers waiting for a pod to come up do not
+        spin on a stale listing.
+        """
+        with self._cache_lock:
+            listed = self._last_list.get(node_id)
+            if (listed is not None and listed.status.phase == 'Running' and
+                    listed.status.pod_ip):
+                return listed
+            cached = self._pod_cache.get(node_id)
+            if (cached is not None and
+                    time.time() - cached[0] < POD_CACHE_TTL_SECONDS):
+                return cached[1]
+        pod = self._core_api.read_namespaced_pod(node_id, self.namespace)
+        with self._cache_lock:
+            now = time.time()
+            # Drop expired reads so that pods deleted outside of this provider
+            # do not accumulate in the cache.
+            for name, (fetched_at, _) in list(self._pod_cache.items()):
+                if now - fetched_at >= POD_CACHE_TTL_SECONDS:
+                    del self._pod_cache[name]
+            self._pod_cache[node_id] = (now, pod)
+        return pod
+
+    def _invalidate_pod(self, node_id: str) -> None:
+        with self._cache_lock:
+            self._pod_cache.pop(node_id, None)
+            self._last_list.pop(node_id, None)
+
+    def _list_non_terminated_pods(
+            self,
+            tag_filters,
+            request_timeout: Optional[int] = None) -> List[Any]:
+        """Returns the pod objects of this cluster matching tag_filters."""
         tag_filters[TAG_RAY_CLUSTER_NAME] = self.cluster_name
         label_selector = to_label_selector(tag_filters)
-        pod_list = kubernetes.core_api().list_namespaced_pod(
+        pod_list = self._core_api.list_namespaced_pod(
             self.namespace,
-            field_selector=field_selector,
-            label_selector=label_selector)
+            field_selector=_NON_TERMINATED_FIELD_SELECTOR,
+            label_selector=label_selector,
+            _request_timeout=request_timeout)
 
         # Don't return pods marked for deletion,
         # i.e. pods with non-null metadata.DeletionTimestamp.
         return [
-            pod.metadata.name
-            for pod in pod_list.items
+            pod for pod in pod_list.items
             if pod.metadata.deletion_timestamp is None
         ]
 
+    def non_terminated_nodes(self, tag_filters):
+        pods = self._list_non_terminated_pods(tag_filters)
+        last_list = {pod.metadata.name: pod for pod in pods}
+        with self._cache_lock:
+            self._last_list = last_list
+        return list(last_list)
+
     def is_running(self, node_id):
-        pod = kubernetes.core_api().read_namespaced_pod(node_id, self.namespace)
+        pod = self._get_pod(node_id)
         return pod.status.phase == 'Running'
 
     def is_terminated(self, node_id):
-        pod = kubernetes.core_api().read_namespaced_pod(node_id, self.namespace)
+        pod = self._get_pod(node_id)
         return pod.status.phase not in ['Running', 'Pending']
 
     def node_tags(self, node_id):
-        pod = kubernetes.core_api().read_namespaced_pod(node_id, self.namespace)
+        pod = self._get_pod(node_id)
         return pod.metadata.labels
 
     def external_ip(self, node_id):
+        # The result does not depend on node_id, so a single lookup is shared
+        # across all nodes. Listing nodes is expensive on large clusters.
+        if self._external_ip_cached is not None:
+            fetched_at, ip = self._external_ip_cached
+            if time.time() - fetched_at < EXTERNAL_IP_CACHE_TTL_SECONDS:
+                return ip
         # Return the IP address of the first node with an external IP
-        nodes = kubernetes.core_api().list_node().items
-        for node in nodes:
-            if node.status.addresses:
-                for address in node.status.addresses:
-                    if address.type == 'ExternalIP':
-                        return address.address
-        # If no external IP is found, use the API server IP
-        api_host = kubernetes.core_api().api_client.configuration.host
-        parsed_url = urlparse(api_host)
-        return parsed_url.hostname
+        nodes = self._core_api.list_node().items
+        ip = next((address.address
+                   for node in nodes
+                   for address in (node.status.addresses or [])
+                   if address.type == 'ExternalIP'), None)
+        if ip is None:
+            # If no external IP is found, use the API server IP
+            ip = self._api_server_host
+        self._external_ip_cached = (time.time(), ip)
+        return ip
 
     def external_port(self, node_id):
         # Extract the NodePort of the head node's SSH service
         # Node id is str e.g., example-cluster-ray-head-v89lb
 
-        # TODO(romilb): Implement caching here for performance.
         # TODO(romilb): Multi-node would need more handling here.
         cluster_name = node_id.split('-ray-head')[0]
-        return kubernetes_utils.get_head_ssh_port(cluster_name, self.namespace)
+        key = (cluster_name, self.namespace)
+        port = self._port_cache.get(key)
+        if port is None:
+            port = kubernetes_utils.get_head_ssh_port(cluster_name,
+                                                      self.namespace)
+            self._port_cache[key] = port
+        return port
 
     def internal_ip(self, node_id):
-        pod = kubernetes.core_api().read_namespaced_pod(node_id, self.namespace)
+        pod = self._get_pod(node_id)
         return pod.status.pod_ip
 
     def get_node_id(self, ip_address, use_internal_ip=True) -> str:
@@ -134,12 +243,11 @@ class KubernetesNodeProvider(NodeProvider):
                 return self._external_ip_cache.get(ip_address)
 
         if not find_node_id():
-            all_nodes = self.non_terminated_nodes({})
-            ip_func = self.internal_ip if use_internal_ip else self.external_ip
-            ip_cache = (self._internal_ip_cache
-                        if use_internal_ip else self._external_ip_cache)
-            for node_id in all_nodes:
-                ip_cache[ip_func(node_id)] = node_id
+            if use_internal_ip:
+                self._refresh_internal_ip_cache()
+            else:
+                for node_id in self.non_terminated_nodes({}):
+                    self._external_ip_cache[self.external_ip(node_id)] = node_id
 
         if not find_node_id():
             if use_internal_ip:
@@ -151,7 +259,7 @@ class KubernetesNodeProvider(NodeProvider):
         return find_node_id()
 
     def set_node_tags(self, node_ids, tags):
-        for _ in range(MAX_TAG_RETRIES - 1):
+        for attempt in range(MAX_TAG_RETRIES - 1):
             try:
                 self._set_node_tags(node_ids, tags)
                 return
@@ -160,7 +268,10 @@ class KubernetesNodeProvider(NodeProvider):
                     logger.info(config.log_prefix +
                                 'Caught a 409 error while setting'
                                 ' node tags. Retrying...')
-                    time.sleep(DELAY_BEFORE_TAG_RETRY)
+                    # Exponential backoff with jitter, so that concurrent
+                    # writers to the same pod do not retry in lockstep.
+                    time.sleep(DELAY_BEFORE_TAG_RETRY * (2**attempt) *
+                               (0.5 + random.random()))
                     continue
                 else:
                     raise
@@ -168,15 +279,22 @@ class KubernetesNodeProvider(NodeProvider):
         self._set_node_tags(node_ids, tags)
 
     def _set_node_tags(self, node_id, tags):
-        pod = kubernetes.core_api().read_namespaced_pod(node_id, self.namespace)
-        pod.metadata.labels.update(tags)
-        kubernetes.core_api().patch_namespaced_pod(node_id, self.namespace, pod)
+        # Patch only the labels instead of sending back the whole pod. This
+        # avoids reading the pod first, and since the patch does not carry a
+        # resourceVersion, it does not conflict with concurrent updates.
+        body = {'metadata': {'labels': tags}}
+        self._core_api.patch_namespaced_pod(node_id, self.namespace, body)
+        # Invalidate after patching, so that a read racing with the patch
+        # cannot leave the pre-patch labels cached.
+        self._invalidate_pod(node_id)
 
     def create_node(self, node_config, tags, count):
         conf = copy.deepcopy(node_config)
         pod_spec = conf.get('pod', conf)
         service_spec = conf.get('service')
         node_uuid = str(uuid4())
+        # All `count` pods share the same tags and pod_spec, so the labels
+        # are set once here rather than per pod.
         tags[TAG_RAY_CLUSTER_NAME] = self.cluster_name
         tags['ray-node-uuid'] = node_uuid
         pod_spec['metadata']['namespace'] = self.namespace
@@ -192,11 +310,14 @@ class KubernetesNodeProvider(NodeProvider):
 
         logger.info(config.log_prefix +
                     'calling create_namespaced_pod (count={}).'.format(count))
-        new_nodes = []
-        for _ in range(count):
-            pod = kubernetes.core_api().create_namespaced_pod(
-                self.namespace, pod_spec)
-            new_nodes.append(pod)
+
+        def _create_pod(_):
+            return self._core_api.create_namespaced_pod(self.namespace,
+                                                        pod_spec)
+
+        # The creations are independent, so submit them concurrently.
+        new_nodes = subprocess_utils.run_in_parallel(_create_pod,
+                                                     list(range(count)))
 
         new_svcs = []
         if service_spec is not None:
@@ -209,7 +330,7 @@ class KubernetesNodeProvider(NodeProvider):
                 metadata['name'] = new_node.metadata.name
                 service_spec['metadata'] = metadata
                 service_spec['spec']['selector'] = {'ray-node-uuid': node_uuid}
-                svc = kubernetes.core_api().create_namespaced_service(
+                svc = self._core_api.create_namespaced_service(
                     self.namespace, service_spec)
                 new_svcs.append(svc)
 
@@ -217,6 +338,13 @@ class KubernetesNodeProvider(NodeProvider):
         # exception. If pod's container is ContainerCreating, then we can assume
         # that resources have been allocated and we can exit.
 
+        # Poll all new pods with a single LIST call per tick, rather than one
+        # read per pod, by selecting on the uuid label set above.
+        label_selector = to_label_selector({'ray-node-uuid': node_uuid})
+        new_node_names = {node.metadata.name for node in new_nodes}
+        # Back off exponentially between polls, so that fast bring-ups are
+        # noticed quickly while slow ones do not flood the API server.
+        delay = 0.25
         start = time.time()
         while True:
             if time.time() - start > self.timeout:
@@ -226,9 +354,14 @@ class KubernetesNodeProvider(NodeProvider):
                     'may be too slow to autoscale.')
             all_ready = True
 
-            for node in new_nodes:
-                pod = kubernetes.core_api().read_namespaced_pod(
-                    node.metadata.name, self.namespace)
+            pods = self._core_api.list_namespaced_pod(
+                self.namespace, label_selector=label_selector).items
+            missing = new_node_names - {pod.metadata.name for pod in pods}
+            if missing:
+                raise config.KubernetesError(
+                    f'Pods {sorted(missing)} were deleted while waiting for '
+                    'nodes to start.')
+            for pod in pods:
                 if pod.status.phase == 'Pending':
                     # Iterate over each pod to check their status
                     if pod.status.container_statuses is not None:
@@ -250,12 +383,17 @@ class KubernetesNodeProvider(NodeProvider):
                         all_ready = False
             if all_ready:
                 break
-            time.sleep(1)
+            time.sleep(delay)
+            delay = min(delay * 1.5, 4.0)
 
     def terminate_node(self, node_id):
         logger.info(config.log_prefix + 'calling delete_namespaced_pod')
+        self._invalidate_pod(node_id)
+        if '-ray-head' in node_id:
+            cluster_name = node_id.split('-ray-head')[0]
+            self._port_cache.pop((cluster_name, self.namespace), None)
         try:
-            kubernetes.core_api().delete_namespaced_pod(
+            self._core_api.delete_namespaced_pod(
                 node_id,
                 self.namespace,
                 _request_timeout=config.DELETION_TIMEOUT)
@@ -267,11 +405,11 @@ class KubernetesNodeProvider(NodeProvider):
             else:
                 raise
         try:
-            kubernetes.core_api().delete_namespaced_service(
+            self._core_api.delete_namespaced_service(
                 node_id,
                 self.namespace,
                 _request_timeout=config.DELETION_TIMEOUT)
-            kubernetes.core_api().delete_namespaced_service(
+            self._core_api.delete_namespaced_service(
                 f'{node_id}-ssh',
                 self.namespace,
                 _request_timeout=config.DELETION_TIMEOUT)
@@ -279,11 +417,12 @@ class KubernetesNodeProvider(NodeProvider):
             pass
 
     def terminate_nodes(self, node_ids):
-        # TODO(romilb): terminate_nodes should be include optimizations for
-        #  deletion of multiple nodes. Currently, it deletes one node at a time.
-        #  We should look in to using deletecollection here for batch deletion.
-        for node_id in node_ids:
-            self.terminate_node(node_id)
+        # Each terminate_node call issues independent, I/O-bound deletes for
+        # the pod and its services, so fan them out across threads.
+        # deletecollection is not used here because node_ids are pod names,
+        # which cannot be matched with a label selector, and the services
+        # would still need to be deleted one by one.
+        subprocess_utils.run_in_parallel(self.terminate_node, node_ids)
 
     def get_command_runner(self,
                            log_prefix,